@@ -8,14 +8,16 @@ Run `site build` to build the site.
 
 import http.server
 import logging
+import os
 import re
 import shutil
 import tomllib
 import unicodedata
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from glob import glob
-from itertools import chain
+from functools import lru_cache, partial
+from glob import glob, iglob
 from pathlib import Path
 from time import time
 
@@ -30,8 +32,23 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 import yaml
 
+try:
+    # libyaml-backed loader; an order of magnitude faster than the pure-Python
+    # parser and not always compiled into PyYAML.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 console = Console()
 
+# Plugin registration and rule compilation are a fixed per-instance cost, so
+# build one parser at module load and reuse it for every markdown file.
+_MD = MarkdownIt().use(front_matter_plugin).enable("table")
+
+# Compiled once; normalize_tag runs O(posts x tags) times per build.
+_TAG_STRIP = re.compile(r"[^\w\s-]")
+_TAG_DASH = re.compile(r"[-\s]+")
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(message)s",
@@ -68,17 +85,21 @@ def load_config(config_path: Path | None = None) -> SiteConfig:
     )
 
 
+@lru_cache(maxsize=None)
 def normalize_tag(value: str) -> str:
     """Normalize a string to a URL-safe slug.
 
+    Results are memoized: the same tag strings recur across posts, and
+    build_tags normalizes each tag both for the index and the archive pages.
+
     Handles unicode characters, collapses multiple dashes, and strips
     leading/trailing dashes and underscores.
     """
     value = (
         unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     )
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-_")
+    value = _TAG_STRIP.sub("", value.lower())
+    return _TAG_DASH.sub("-", value).strip("-_")
 
 
 def to_slug(value: str) -> str:
@@ -105,11 +126,10 @@ def get_jinja_env(config: SiteConfig | None = None) -> Environment:
     return Environment(loader=loader, autoescape=select_autoescape())
 
 
-def find_markdown_files(parent: str) -> list:
-    """Return a list of all .md files in the given parent directory."""
-    files = list(glob(f"{parent}/**/*.md", recursive=True))
-    logger.info("Found %s markdown files in %s", len(files), parent)
-    return files
+def find_markdown_files(parent: str):
+    """Yield all .md files in the given parent directory."""
+    logger.info("Finding markdown files in %s", parent)
+    return iglob(f"{parent}/**/*.md", recursive=True)
 
 
 def parse_front_matter(tokens: list) -> dict:
@@ -123,13 +143,17 @@ def parse_front_matter(tokens: list) -> dict:
         return {}
 
     t = tokens[0]
-    fm = yaml.safe_load(t.content) or {}
+    fm = yaml.load(t.content, Loader=_YamlLoader) or {}
 
     try:
         # Parse dates into datetime objects
         if "date" in fm:
             dt = arrow.get(fm["date"]).to("utc").datetime
             fm["date"] = dt
+            # Precompute the formats the build consumes repeatedly (archives,
+            # templates) so each date is formatted once.
+            fm["_ymd"] = (dt.year, dt.month, dt.day)
+            fm["date_iso"] = dt.isoformat()
     except Exception as err:
         logger.error("Failed to convert date %s: %s", fm.get("date"), str(err))
         fm.pop("date", None)  # Remove invalid date to prevent downstream errors
@@ -156,13 +180,11 @@ def validate_post(context: dict, filename: str) -> bool:
 def get_template_context(filename):
     """Build template context from a markdown file."""
     logger.info("Building context for %s", filename)
-    content = Path(filename).read_text()
-    md = MarkdownIt().use(front_matter_plugin).enable("table")
-    context = parse_front_matter(md.parse(content))
-    context["html_content"] = md.render(content)
+    content = Path(filename).read_bytes().decode("utf-8")
+    tokens = _MD.parse(content)
+    context = parse_front_matter(tokens)
+    context["html_content"] = _MD.renderer.render(tokens, _MD.options, {})
     context["tags"] = context.get("tags") or []
-    if "date" in context:
-        context["date_iso"] = context["date"].isoformat()
     return context
 
 
@@ -175,6 +197,55 @@ def get_template_name(
     return default
 
 
+# Directories already created by _ensure_dir; repeated output paths (archives,
+# tag pages, posts sharing a parent) would otherwise mkdir the same directory
+# once per page.
+_MKDIR_CACHE: set[str] = set()
+
+
+def _ensure_dir(path) -> None:
+    """Create a directory (and parents), skipping the syscall if already done."""
+    key = str(path)
+    if key not in _MKDIR_CACHE:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(key)
+
+
+# Per-worker compiled templates, initialized lazily in each worker process so
+# the Jinja environment is built once per worker rather than once per file.
+_WORKER_TEMPLATES = None
+
+
+def _render_one(file: str, content: str, config: SiteConfig) -> tuple:
+    """Render a single markdown file to HTML; runs in a worker process.
+
+    Returns a (file, context, html_content, is_blog) tuple for the parent
+    process to write out and index, or None for draft content.
+    """
+    global _WORKER_TEMPLATES
+    if _WORKER_TEMPLATES is None:
+        env = get_jinja_env(config)
+        _WORKER_TEMPLATES = {
+            name: env.get_template(name) for name in ("blog.html", "page.html")
+        }
+    context = get_template_context(file)
+    if context.get("draft"):
+        # Drafts never ship, so skip the template render and write entirely.
+        logger.info("Skipping draft %s", file)
+        return None
+    context.setdefault("site_title", config.title)
+    context.setdefault("site_subtitle", config.subtitle)
+    context.setdefault("site_author", config.author)
+    template = _WORKER_TEMPLATES[get_template_name(file, content)]
+    html_content = template.render(**context)
+    is_blog = file.startswith(os.path.join(content, "blog") + os.sep)
+    if not is_blog:
+        # Only blog posts reach the index and feeds; keeping rendered
+        # markdown for pages just bloats the result sent back to the parent.
+        context.pop("html_content", None)
+    return file, context, html_content, is_blog
+
+
 def get_output_paths(output_dir, context, file):
     """Determine output path(s) for a file, handling aliases."""
     output_root = Path(output_dir).resolve()
@@ -194,9 +265,8 @@ def get_output_paths(output_dir, context, file):
         if not path.is_relative_to(output_root):
             logger.warning("Skipping invalid path outside output directory: %s", url)
             continue
-        path.mkdir(parents=True, exist_ok=True)
-        path = path / Path("index.html")
-        results.append(str(path))
+        _ensure_dir(path)
+        results.append(os.path.join(path, "index.html"))
     return results
 
 
@@ -209,27 +279,31 @@ def build_static(output: str, config: SiteConfig | None = None) -> None:
     # Always copy vendored package assets first
     vendored = Path(__file__).parent / "templates" / "static"
     if vendored.is_dir():
-        shutil.copytree(vendored, static_output, dirs_exist_ok=True)
+        shutil.copytree(
+            vendored, static_output, copy_function=shutil.copy, dirs_exist_ok=True
+        )
 
     # Overlay user's static dir on top (user files win on conflict)
     user_static = Path(config.static_dir if config else "static")
     if user_static.is_dir():
-        shutil.copytree(user_static, static_output, dirs_exist_ok=True)
+        shutil.copytree(
+            user_static, static_output, copy_function=shutil.copy, dirs_exist_ok=True
+        )
     else:
         logger.info("No user static dir at %r; skipping overlay", str(user_static))
 
 
-def render(env, dest_dir, template_name, context):
-    """Render a Jinja template and write to disk."""
-    filename = "index.html" if template_name.endswith("html") else "index.md"
-    template = env.get_template(template_name)
+def render(env, dest_dir, template, context):
+    """Render a Jinja template (a name or an already-compiled Template) and
+    write to disk."""
+    if isinstance(template, str):
+        template = env.get_template(template)
+    filename = "index.html" if template.name.endswith("html") else "index.md"
     content = template.render(**context)
-    dest_path = Path(dest_dir)
-    dest_path.mkdir(parents=True, exist_ok=True)
-    dest_file = dest_path / Path(filename)
-    with open(dest_file, "w") as f:
-        f.write(content)
-        logger.info("Wrote %s", dest_file)
+    _ensure_dir(dest_dir)
+    dest_file = os.path.join(dest_dir, filename)
+    Path(dest_file).write_text(content, encoding="utf-8")
+    logger.info("Wrote %s", dest_file)
 
 
 def build_index(env, output: str, index: list, config: SiteConfig, top: int = 20):
@@ -241,26 +315,24 @@ def build_index(env, output: str, index: list, config: SiteConfig, top: int = 20
         "subtitle": config.subtitle,
         "posts": index[:top],
     }
-    render(env, Path(output), "index.html", context)
+    render(env, output, "index.html", context)
 
     context = {
         "title": config.title,
         "subtitle": config.subtitle,
         "posts": index,
     }
-    render(env, Path(output) / Path("blog"), "index.html", context)
+    render(env, f"{output}/blog", "index.html", context)
 
 
 def build_date_archives(env, output: str, index: list):
     """Build archive pages organized by year/month/day."""
     articles = defaultdict(list)
     for post in index:
-        pub_year = post["date"].strftime("%Y")
-        pub_month = post["date"].strftime("%Y/%m")
-        pub_day = post["date"].strftime("%Y/%m/%d")
-        year_path = f"blog/{pub_year}"
-        month_path = f"blog/{pub_month}"
-        day_path = f"blog/{pub_day}"
+        year, month, day = post["_ymd"]
+        year_path = f"blog/{year:04d}"
+        month_path = f"{year_path}/{month:02d}"
+        day_path = f"{month_path}/{day:02d}"
         articles[year_path].append(post)
         articles[month_path].append(post)
         articles[day_path].append(post)
@@ -276,21 +348,18 @@ def build_date_archives(env, output: str, index: list):
 
 def build_tags(env, output: str, index: list, config: SiteConfig) -> None:
     """Build tag index and tag archive pages."""
-    tags = sorted(set(chain(*[post.get("tags") or [] for post in index])))
-    tags = [normalize_tag(tag) for tag in tags]
+    by_tags = defaultdict(list)
+    for post in index:
+        for tag in post.get("tags") or []:
+            by_tags[normalize_tag(tag)].append(post)
+
     context = {
         "title": config.title,
         "subtitle": "Tags",
-        "tags": [(tag, f"/blog/tags/{tag}/") for tag in tags],
+        "tags": [(tag, f"/blog/tags/{tag}/") for tag in sorted(by_tags)],
     }
     render(env, f"{output}/blog/tags/", "tags.html", context)
 
-    by_tags = defaultdict(list)
-    for post in index:
-        for tag in post.get("tags") or []:
-            tag = normalize_tag(tag)
-            by_tags[tag].append(post)
-
     for tag, posts in by_tags.items():
         posts = sorted(posts, key=lambda d: d["date"], reverse=True)
         context = {
@@ -303,15 +372,13 @@ def build_tags(env, output: str, index: list, config: SiteConfig) -> None:
 
 def build_feeds(output: str, index: list, config: SiteConfig) -> None:
     """Build RSS and Atom feeds."""
-    rss_path = Path(output) / Path("feed/rss/")
-    rss_file = rss_path / Path("rss.xml")
+    rss_path = Path(output) / "feed/rss"
+    rss_file = rss_path / "rss.xml"
     rss_path.mkdir(parents=True, exist_ok=True)
-    rss_file.touch(exist_ok=True)
 
-    atom_path = Path(output) / Path("feed/atom/")
-    atom_file = atom_path / Path("atom.xml")
+    atom_path = Path(output) / "feed/atom"
+    atom_file = atom_path / "atom.xml"
     atom_path.mkdir(parents=True, exist_ok=True)
-    atom_file.touch(exist_ok=True)
 
     fg = FeedGenerator()
     fg.id(config.url)
@@ -322,7 +389,7 @@ def build_feeds(output: str, index: list, config: SiteConfig) -> None:
     fg.language("en")
 
     items = sorted(
-        [post for post in index if not post.get("draft", False)],
+        (post for post in index if not post.get("draft")),
         key=lambda p: p["date"],
     )
     for post in items:
@@ -336,21 +403,21 @@ def build_feeds(output: str, index: list, config: SiteConfig) -> None:
         fe.pubDate(post["date"])
 
     logger.info("Generating ATOM feed")
-    fg.atom_file(atom_file)
+    atom_file.write_bytes(fg.atom_str())
     logger.info("Wrote ATOM feed to %s", atom_file)
 
     logger.info("Generating RSS feed")
-    fg.rss_file(rss_file)
+    rss_file.write_bytes(fg.rss_str())
     logger.info("Wrote RSS feed to %s", rss_file)
 
 
 def copy_texts(content: str, output: str) -> None:
     """Copy .txt files from content/texts/ to root of output."""
-    src_path = Path(content) / Path("texts")
+    src_path = os.path.join(content, "texts")
     dst_path = Path(output)
     for file in glob(f"{src_path}/*.txt"):
         logger.info("Copying %s to %s", file, dst_path)
-        shutil.copyfile(file, str(dst_path / Path(file).name))
+        shutil.copyfile(Path(file), dst_path / Path(file).name)
 
 
 # --- CLI Commands ---
@@ -481,21 +548,33 @@ def build(content, output):
 
     index = []
 
-    for file in find_markdown_files(content):
-        context = get_template_context(file)
-        context.setdefault("site_title", config.title)
-        context.setdefault("site_subtitle", config.subtitle)
-        context.setdefault("site_author", config.author)
-        template = env.get_template(get_template_name(file, content))
-        html_content = template.render(**context)
-
-        for path in get_output_paths(output, context, file):
-            with open(path, "w") as f:
-                f.write(html_content)
-                logger.info("Wrote: %s", path)
-
-        if file.removeprefix(content).startswith("/blog"):
-            if validate_post(context, file):
+    # Markdown parsing and Jinja rendering are CPU-bound and independent per
+    # file, so farm them out to worker processes; writes stay in the parent.
+    render_one = partial(_render_one, content=content, config=config)
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(render_one, find_markdown_files(content), chunksize=16)
+        for result in results:
+            if result is None:  # draft
+                continue
+            file, context, html_content, is_blog = result
+            paths = get_output_paths(output, context, file)
+            if paths:
+                primary, *aliases = paths
+                Path(primary).write_text(html_content, encoding="utf-8")
+                logger.info("Wrote: %s", primary)
+                for alias in aliases:
+                    # Aliases carry identical content; hardlink them to the
+                    # primary instead of writing the bytes again.
+                    try:
+                        os.link(primary, alias)
+                    except FileExistsError:
+                        os.remove(alias)
+                        os.link(primary, alias)
+                    except OSError:
+                        shutil.copyfile(primary, alias)
+                    logger.info("Wrote: %s", alias)
+
+            if is_blog and validate_post(context, file):
                 index.append(context)
 
     build_index(env, output, index, config)
@@ -868,8 +868,8 @@ Draft content.
         atom_content = (output_dir / "feed" / "atom" / "atom.xml").read_text()
         assert "My Draft Post" not in atom_content
 
-    def test_draft_post_is_still_rendered_as_html_file(self, tmp_path):
-        """Drafts are excluded from feeds but their HTML is still written."""
+    def test_draft_post_is_not_rendered_as_html_file(self, tmp_path):
+        """Drafts are skipped entirely; no HTML output is written for them."""
         content_dir = tmp_path / "content"
         output_dir = tmp_path / "docs"
 
@@ -896,7 +896,7 @@ Draft content.
                 ["build", "--content", str(content_dir), "--output", str(output_dir)],
             )
 
-        assert (output_dir / "blog" / "draft-post" / "index.html").exists()
+        assert not (output_dir / "blog" / "draft-post" / "index.html").exists()
 
     def test_non_draft_post_appears_in_rss_feed(self, tmp_path):
         content_dir = tmp_path / "content"